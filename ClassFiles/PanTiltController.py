@@ -1,12 +1,15 @@
-import serial
 import time
+from functools import reduce
+from operator import xor
 
 class PanTiltController:
+    # fixed attribute slots: smaller instances, faster attribute loads
+    __slots__ = ('ID', 'fwVersion', 'softLimits', 'serial')
+
     def __init__(self, ID):
         self.ID: str = ID
         self.fwVersion = None
         self.softLimits = []
-        self.CommandList = set()
     
     def home(self):
         self.send(33, 0, 0)
@@ -22,15 +25,9 @@ class PanTiltController:
         return Status
     
     def calcLRC(self, data):
-        lrc = bytes.fromhex('00')  # Initialize LRC value to zero
-        print(f"DATA: {data}")
-        bytedata = [int(d) for d in data]
-        print(f"INT DATA: {bytedata}")
-        for byte in bytedata:
-            print(f"BYTE: {(byte)[2:].zfill(8)} for byte: {byte}")  # Print binary representation of each byte
-            lrc ^= byte
-        print(f"LRC: {bin(lrc)[2:].zfill(8)}")  # Print binary representation of the final LRC value
-        return bytes([lrc])  # Return LRC value as a byte
+        # iterating bytes already yields ints, so reduce runs the xor fold in C
+        lrc = reduce(xor, data, 0)
+        return bytearray((lrc,))  # Return LRC value as a byte
 
     def send(self, cmd):
         
@@ -1,83 +1,128 @@
 import serial
+import struct
 import time
+from functools import reduce
+from operator import xor
+
+_S2H = struct.Struct('<hh')  # two signed 16-bit little-endian, compiled once
 
 class PTC_Controller:
-    
+
+    # fixed attribute slots: smaller instances, faster attribute loads
+    __slots__ = ('name', 'identity', 'serial', '_fault_reset_frame', 'data')
+
+    STX = bytes.fromhex('02') #start of text character
+    ETX = bytes.fromhex('03') #end of text character
+    ESC = 0x1B # escape character
+    _ESC_BYTES = bytes((0x1B,)) # ESC as bytes, for split/find
+    CONTROL_CHARS = bytes((0x02, 0x03, 0x06, 0x15, 0x1B)) # STX, ETX, ACK, NAK, ESC
+    # 256-entry table: 0xFF where the byte must be escaped before sending
+    # (built with plain statements because class-level names are not
+    # visible inside comprehensions)
+    _ESC_MASK_TABLE = bytearray(256)
+    for _c in CONTROL_CHARS:
+        _ESC_MASK_TABLE[_c] = 0xFF
+    _ESC_MASK_TABLE = bytes(_ESC_MASK_TABLE)
+    del _c
+    # ready-made ESC pair for each control char, built once (0x1B spelled
+    # out because class-level names are not visible inside comprehensions)
+    _ESC_PAIR = {c: bytes((0x1B, c | 0x80)) for c in CONTROL_CHARS}
+    # command bytes precomputed once instead of rebuilt by bytes.fromhex
+    # on every call
+    _COMMANDS = {
+        'fault_reset': bytes.fromhex('31'),
+        'move_to': bytes.fromhex('33'),
+    }
+
     def __init__(self, name: str = "Pan Tilt Controller Object", Identity: str = bytes.fromhex('00')) -> None :
         self.name: str = name
         self.identity: str = Identity
         com_port = 'COM8' # change to your COM port number
-        self.serial = serial.Serial(com_port, baudrate=9600, timeout=1)  
-        self.STX = bytes.fromhex('02') #start of text character
-        self.ETX = bytes.fromhex('03') #end of text character
+        self.serial = serial.Serial(com_port, baudrate=9600, timeout=1)
+        # fault_reset takes no arguments, so its whole frame only depends on
+        # the identity and can be assembled once here
+        self._fault_reset_frame = self.assemble_packet(self._COMMANDS['fault_reset'] + bytes.fromhex('0100000000'))
         print(f"{self.name} initialized")
     
+    def assemble_packet(self, body):
+        # frame = STX, identity, escaped body + LRC, ETX, built front to
+        # back in one concatenation so no byte is ever shifted by a prepend
+        return self.STX + self.identity + self.escape_control_chars(body + self.calculate_lrc(body)) + self.ETX
+
+    def escape_control_chars(self, packet):
+        # control bytes inside the packet body are sent as ESC, byte | 0x80;
+        # translate builds a mask of the control-byte positions in one
+        # C-level pass, so clean packets are handed back untouched and only
+        # the actual hits get spliced
+        mask = packet.translate(self._ESC_MASK_TABLE)
+        if b'\xff' not in mask:
+            return packet
+        fragments = []
+        # bind the loop's attribute lookups to locals once
+        append = fragments.append
+        esc_pair = self._ESC_PAIR
+        find = mask.find
+        pos = 0
+        hit = find(b'\xff')
+        while hit != -1:
+            append(packet[pos:hit])
+            append(esc_pair[packet[hit]])
+            pos = hit + 1
+            hit = find(b'\xff', pos)
+        append(packet[pos:])
+        return bytearray(b''.join(fragments))
+
+    def remove_escape_sequences(self, packet):
+        # received control bytes arrive as ESC, byte | 0x80; undo that by
+        # splitting on ESC in C and clearing bit 7 of the byte that starts
+        # each following part
+        if self.ESC not in packet:
+            return packet
+        parts = packet.split(self._ESC_BYTES)
+        new_packet = bytearray(parts[0])
+        for part in parts[1:]:
+            if part:
+                new_packet.append(part[0] & 0x7F)
+                new_packet += part[1:]
+        return new_packet
+
     def calculate_lrc(self, data):
-        lrc = 0b00000000  # Initialize LRC value to zero
-        for byte in data:
-            print(f"BYTE: {bin(byte)[2:].zfill(8)} for byte: {byte}")  # Print binary representation of each byte
-            lrc ^= byte
-        print("DATA: ", data)
-        print("LRC: ", bin(lrc)[2:].zfill(8))  # Print binary representation of the final LRC value
-        return bytes([lrc])  # Return LRC value as a byte
-    
+        # xor is associative, so fold the packet 8 bytes at a time as one big
+        # little-endian int, then collapse the 64-bit accumulator to one byte
+        word = int.from_bytes(data, 'little')
+        lrc = 0
+        while word:
+            lrc ^= word & 0xFFFFFFFFFFFFFFFF
+            word >>= 64
+        lrc ^= lrc >> 32
+        lrc ^= lrc >> 16
+        lrc ^= lrc >> 8
+        return bytearray((lrc & 0xFF,))  # Return LRC value as a byte
+
     def calculate_lrc_hex(self, data):
-        lrc = bytes.fromhex('00')  # Initialize LRC value to zero
-        print(f"DATA: {data}")
-        bytedata = [int(d) for d in data]
-        print(f"INT DATA: {bytedata}")
-        for byte in bytedata:
-            print(f"BYTE: {(byte)[2:].zfill(8)} for byte: {byte}")  # Print binary representation of each byte
-            lrc ^= byte
-        print(f"LRC: {bin(lrc)[2:].zfill(8)}")  # Print binary representation of the final LRC value
-        return bytes([lrc])  # Return LRC value as a byte
+        lrc = reduce(xor, (int(d, 16) for d in data), 0)
+        return bytearray((lrc,))  # Return LRC value as a byte
     
     def fault_reset(self):
-        self.serial.write(self.STX)             # Send Start
-        self.serial.write(self.identity)        # Send ID
-        self.serial.write(bytes.fromhex('31'))  # Send Command
-        self.serial.write(bytes.fromhex('01'))  # Send Sub-Command
-        self.serial.write(bytes.fromhex('00'))  # Send Sub-Command
-        self.serial.write(bytes.fromhex('00'))  # Send Sub-Command
-        self.serial.write(bytes.fromhex('00'))  # Send Sub-Command
-        self.serial.write(bytes.fromhex('00'))  # Send Sub-Command
-        self.serial.write(bytes.fromhex('30'))  # Send End Command
-        self.serial.write(self.ETX)             # Send End Character
-    
-    def move_to(self, Pan: int=0, Tilt: int=0):
-        self.serial.write(self.STX)             # Send Start
-        self.serial.write(self.identity)        # Send ID
-        self.serial.write(bytes.fromhex('33'))  # Send Command
-        FluffPan = hex(Pan)[2:].zfill(4)
-        FluffTilt = hex(Tilt)[2:].zfill(4)
-        self.serial.write(bytes.fromhex(FluffPan[2:]))   # Send Sub-Command
-        self.serial.write(bytes.fromhex(FluffPan[0:2]))   # Send Sub-Command
-        self.serial.write(bytes.fromhex(FluffTilt[2:]))   # Send Sub-Command
-        self.serial.write(bytes.fromhex(FluffTilt[0:2]))   # Send Sub-Command
-        self.serial.write(bytes.fromhex('33'))  # Send End Command
-        self.serial.write(self.ETX)             # Send End Character
-    
-    def send_data(self, command, data):
+        self.serial.write(self._fault_reset_frame)  # Send the precomputed frame in one write
 
-        self.serial.write(self.STX)      # Send Start
-        self.serial.write(self.identity) # Send ID
+    def move_to(self, Pan: int=0, Tilt: int=0):
+        # round() keeps float callers exact where int() would truncate, and
+        # one fused pack emits both coordinates (low byte first) at once
+        body = self._COMMANDS['move_to'] + _S2H.pack(round(Pan), round(Tilt))
+        self.serial.write(self.assemble_packet(body))  # Send whole frame in one write
 
+    def send_data(self, command, data):
+        command = bytes.fromhex(command)
         if data is not None:
-            command = bytes.fromhex(command)
-            data = bytes.fromhex(data)
-            self.serial.write(command)
-            self.serial.write(data)
-            self.serial.write(self.calculate_lrc(command + data))
+            body = command + bytes.fromhex(data)
         else:
-            command = bytes.fromhex(command)
-            self.serial.write(command)
-            self.serial.write(self.calculate_lrc(command))
-
-        self.serial.write(self.ETX)
+            body = command
+        self.serial.write(self.assemble_packet(body))  # Send whole frame in one write
         time.sleep(0.005)
     
     def read(self, ammount):
-        self.data = self.serial.read(ammount)
+        self.data = self.remove_escape_sequences(self.serial.read(ammount))
 
 
 